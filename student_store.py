@@ -0,0 +1,225 @@
+import streamlit as st
+import csv
+import fcntl
+import functools
+import os
+import pandas as pd
+from contextlib import contextmanager
+from datetime import datetime
+
+# ===============================
+# 🎀 Student data store helpers
+# ===============================
+
+FILENAME = "students.csv"
+PARQUET_CACHE = "students.parquet"
+
+DTYPES = {
+    "Name": "string", "Roll": "string", "Course": "string", "Gender": "string",
+    "DOB": "string", "Email": "string", "Phone": "string", "Address": "string",
+    "Subjects": "string", "Attendance": "float32", "Marks": "float32", "Grade": "string"
+}
+
+FIELDNAMES = [
+    "Name", "Roll", "Course", "Gender", "DOB", "Email",
+    "Phone", "Address", "Subjects", "Attendance", "Marks", "Grade"
+]
+
+GENDER_OPTIONS = ["Male", "Female", "Other"]
+GENDER_INDEX = {g: i for i, g in enumerate(GENDER_OPTIONS)}
+
+def parse_dob(value):
+    try:
+        return datetime.strptime(str(value), "%Y-%m-%d")
+    except (ValueError, TypeError):
+        return datetime(2000, 1, 1)
+
+LOCKFILE = FILENAME + ".lock"
+
+@contextmanager
+def locked():
+    with open(LOCKFILE, "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+
+@st.cache_data
+def _load_cached(mtime):
+    with open(FILENAME, newline="", encoding="utf-8", buffering=1 << 20) as f:
+        reader = csv.DictReader(f)
+        return list(reader)
+
+def load_data():
+    if not os.path.exists(FILENAME):
+        return []
+    return _load_cached(os.path.getmtime(FILENAME))
+
+@st.cache_data
+def _load_indexed(mtime):
+    rows = _load_cached(mtime)
+    return rows, {row.get("Roll"): i for i, row in enumerate(rows)}
+
+def load_indexed():
+    if not os.path.exists(FILENAME):
+        return [], {}
+    return _load_indexed(os.path.getmtime(FILENAME))
+
+@st.cache_data
+def _load_df_cached(mtime):
+    if os.path.exists(PARQUET_CACHE) and os.path.getmtime(PARQUET_CACHE) >= mtime:
+        return pd.read_parquet(PARQUET_CACHE)
+    df = pd.read_csv(FILENAME, dtype=DTYPES, keep_default_na=False, na_values=[""])
+    try:
+        df.to_parquet(PARQUET_CACHE, compression="zstd")
+    except ImportError:
+        pass
+    return df
+
+def load_df():
+    if not os.path.exists(FILENAME):
+        return pd.DataFrame(columns=list(DTYPES))
+    return _load_df_cached(os.path.getmtime(FILENAME))
+
+def save_data(data):
+    tmp = FILENAME + ".tmp"
+    with locked():
+        with open(tmp, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+            writer.writeheader()
+            writer.writerows(data)
+        os.replace(tmp, FILENAME)
+    _clear_caches()
+
+def _clear_caches():
+    _load_cached.clear()
+    _load_indexed.clear()
+    _load_df_cached.clear()
+    _dashboard_stats.clear()
+    _csv_bytes.clear()
+    _search_cached.cache_clear()
+
+def calculate_grade(marks):
+    try:
+        marks = float(marks)
+    except (ValueError, TypeError):
+        marks = 0
+    if marks >= 90:
+        return "A"
+    elif marks >= 75:
+        return "B"
+    elif marks >= 60:
+        return "C"
+    elif marks >= 40:
+        return "D"
+    else:
+        return "F"
+
+@st.cache_data
+def _csv_bytes(mtime):
+    with open(FILENAME, "rb") as f:
+        return f.read()
+
+def csv_bytes():
+    return _csv_bytes(os.path.getmtime(FILENAME))
+
+def dashboard_stream():
+    n = 0
+    sum_marks = 0.0
+    sum_att = 0.0
+    with open(FILENAME, newline="", encoding="utf-8", buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return 0, 0, 0
+        mi = header.index("Marks")
+        ai = header.index("Attendance")
+        for row in reader:
+            n += 1
+            sum_marks += float(row[mi] or 0)
+            sum_att += float(row[ai] or 0)
+    if not n:
+        return 0, 0, 0
+    return n, round(sum_marks / n, 2), round(sum_att / n, 2)
+
+@st.cache_data
+def _dashboard_stats(mtime):
+    return dashboard_stream()
+
+def dashboard_stats():
+    if not os.path.exists(FILENAME):
+        return 0, 0, 0
+    return _dashboard_stats(os.path.getmtime(FILENAME))
+
+def grade_series(marks):
+    return pd.cut(pd.to_numeric(marks, errors="coerce").fillna(0),
+                  bins=[0, 40, 60, 75, 90, 101], labels=list("FDCBA"), right=False)
+
+def add_student(name, roll, course, gender, dob, email, phone, address, subjects, attendance, marks):
+    _, index = load_indexed()
+    if roll in index:
+        st.error(f"⚠️ Roll number '{roll}' already exists.")
+        return
+    new_student = {
+        "Name": name,
+        "Roll": roll,
+        "Course": course,
+        "Gender": gender,
+        "DOB": dob,
+        "Email": email,
+        "Phone": phone,
+        "Address": address,
+        "Subjects": subjects,
+        "Attendance": attendance,
+        "Marks": marks,
+        "Grade": calculate_grade(marks)
+    }
+    with locked():
+        needs_header = not os.path.exists(FILENAME) or os.path.getsize(FILENAME) == 0
+        with open(FILENAME, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=FIELDNAMES)
+            if needs_header:
+                writer.writeheader()
+            writer.writerow(new_student)
+    _clear_caches()
+
+def delete_student(roll):
+    if not os.path.exists(FILENAME):
+        return False
+    tmp = FILENAME + ".tmp"
+    found = False
+    with locked():
+        with open(FILENAME, newline="", encoding="utf-8", buffering=1 << 20) as fin, \
+             open(tmp, "w", newline="", encoding="utf-8", buffering=1 << 20) as fout:
+            reader = csv.DictReader(fin)
+            writer = csv.DictWriter(fout, fieldnames=FIELDNAMES)
+            writer.writeheader()
+            for row in reader:
+                if row.get("Roll") == roll:
+                    found = True
+                    continue
+                writer.writerow(row)
+        os.replace(tmp, FILENAME)
+    _clear_caches()
+    return found
+
+@functools.lru_cache(maxsize=1024)
+def _search_cached(mtime, roll):
+    rows, index = _load_indexed(mtime)
+    i = index.get(roll)
+    return rows[i] if i is not None else None
+
+def search_student(roll):
+    if not os.path.exists(FILENAME):
+        return None
+    return _search_cached(os.path.getmtime(FILENAME), roll)
+
+def update_student(roll, updated_info):
+    data, index = load_indexed()
+    i = index.get(roll)
+    if i is None:
+        return False
+    data[i].update(updated_info)
+    save_data(data)
+    return True